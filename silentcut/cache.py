@@ -0,0 +1,70 @@
+"""Persistent cache for expensive per-file probe results.
+
+Values are keyed on (kind, path, mtime_ns, size) so editing or replacing
+a file invalidates its entries automatically. Re-running on the same
+input — typical when tuning thresholds — then skips the ffprobe /
+volumedetect subprocess entirely. The cache is best-effort: any IO
+problem just means recomputing.
+"""
+import json
+import os
+from pathlib import Path
+
+_enabled = True
+_entries: dict[str, float] | None = None
+
+
+def disable() -> None:
+    """Turn the cache off for this process (the --no-cache flag)."""
+    global _enabled
+    _enabled = False
+
+
+def _cache_file() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "silentcut" / "probe.json"
+
+
+def _load() -> dict[str, float]:
+    global _entries
+    if _entries is None:
+        try:
+            _entries = json.loads(_cache_file().read_text())
+        except (OSError, ValueError):
+            _entries = {}
+    return _entries
+
+
+def _key(kind: str, path: str) -> str | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return f"{kind}:{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def get(kind: str, path: str) -> float | None:
+    """Return the cached value for this kind and file, if still valid."""
+    if not _enabled:
+        return None
+    key = _key(kind, path)
+    if key is None:
+        return None
+    return _load().get(key)
+
+
+def put(kind: str, path: str, value: float) -> None:
+    """Store a computed value for this kind and file."""
+    if not _enabled:
+        return
+    key = _key(kind, path)
+    if key is None:
+        return
+    entries = _load()
+    entries[key] = value
+    try:
+        cache_file = _cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(entries))
+    except OSError:
+        pass
@@ -1,7 +1,188 @@
+import asyncio
+import os
 import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-import math
 from silentcut.models import Segment
+from silentcut.utils import handle_error
+
+
+@lru_cache(maxsize=16)
+def _atempo_chain(speed_factor: float) -> str:
+    """
+    Build the audio speed filter chain for a speed factor, with a leading
+    comma so it can be appended directly after asetpts. atempo is limited
+    to [0.5, 2.0] per instance, so larger factors are chained. Cached
+    because a timeline typically uses only one or two distinct factors.
+    """
+    filters = []
+    while speed_factor > 2.0:
+        filters.append("atempo=2.0")
+        speed_factor /= 2.0
+    if speed_factor != 1.0:
+        filters.append(f"atempo={speed_factor:.2f}")
+    return "," + ",".join(filters) if filters else ""
+
+
+def _extract_segment(
+    input_path: str,
+    start: float,
+    end: float,
+    out_path: str
+) -> None:
+    """Stream-copy one segment into out_path. Must stay at module level
+    so it is picklable for ProcessPoolExecutor."""
+    # -ss before -i seeks on keyframes, which is what makes the copy path
+    # fast; -avoid_negative_ts keeps timestamps sane for the concat
+    # demuxer. -threads 2 caps ffmpeg's own pool so workers don't
+    # oversubscribe the machine.
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-threads", "2",
+            "-ss", str(start),
+            "-to", str(end),
+            "-i", input_path,
+            "-c", "copy",
+            "-avoid_negative_ts", "make_zero",
+            out_path
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=True
+    )
+
+
+def _cut_and_concat_copy(
+    input_path: str,
+    output_path: str,
+    speech_segments: list[Segment]
+) -> None:
+    """
+    Lossless fast path: extract each segment with stream copy into temp
+    files, then join them with the concat demuxer. No decode or re-encode
+    happens, so this is bounded by disk IO instead of libx264.
+    """
+    with tempfile.TemporaryDirectory(prefix="silentcut_") as tmp_dir:
+        tmp = Path(tmp_dir)
+        part_paths = [tmp / f"part_{i}.mp4"
+                      for i in range(len(speech_segments))]
+
+        # Stream-copy extraction is IO-bound, so the segments are
+        # embarrassingly parallel across worker processes.
+        max_workers = max(1, (os.cpu_count() or 2) // 2)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(_extract_segment, input_path,
+                            seg.start, seg.end, str(part_paths[i]))
+                for i, seg in enumerate(speech_segments)
+            ]
+            for future in as_completed(futures):
+                future.result()  # Re-raise any CalledProcessError
+
+        _concat_parts(tmp, part_paths, output_path)
+
+
+def _concat_parts(tmp: Path, part_paths: list[Path],
+                  output_path: str) -> None:
+    """Join already-cut part files losslessly with the concat demuxer."""
+    concat_list = tmp / "concat.txt"
+    concat_list.write_text(
+        "".join(f"file '{p}'\n" for p in part_paths))
+
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-f", "concat",
+            "-safe", "0",
+            "-i", str(concat_list),
+            "-c", "copy",
+            output_path
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=True
+    )
+
+
+async def _encode_segment(
+    input_path: str,
+    seg: Segment,
+    out_path: str,
+    fluid: bool,
+    semaphore: asyncio.Semaphore
+) -> None:
+    """Re-encode one segment with its speed filters applied."""
+    v_filter = f"setpts={1.0 / seg.speed_factor:.4f}*PTS"
+    if fluid and seg.speed_factor > 1.05:
+        # Add motion blur via frame blending
+        # tmix merges 'frames' consecutive frames. 3 is a good balance.
+        v_filter += ",tmix=frames=3:weights='1 1 1'"
+
+    a_chain = _atempo_chain(seg.speed_factor)
+    a_filter = a_chain[1:] if a_chain else "anull"
+
+    async with semaphore:
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-y",
+            "-loglevel", "error",
+            "-nostats",
+            "-ss", str(seg.start),
+            "-to", str(seg.end),
+            "-i", input_path,
+            "-filter:v", v_filter,
+            "-filter:a", a_filter,
+            "-c:v", "libx264",
+            "-preset", "ultrafast",
+            "-crf", "20",
+            "-c:a", "aac",
+            "-b:a", "192k",
+            out_path,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await proc.communicate()
+        returncode = proc.returncode
+        assert returncode is not None  # communicate() waits for exit
+        if returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode, "ffmpeg", stderr=stderr)
+
+
+def _cut_and_concat_encode(
+    input_path: str,
+    output_path: str,
+    speech_segments: list[Segment],
+    fluid: bool
+) -> None:
+    """
+    Re-encode path for timelines with speed changes: one small ffmpeg per
+    segment, run concurrently, then a lossless concat-demuxer merge. This
+    parallelizes across segments at the process level instead of
+    serializing the decode through one giant filter_complex.
+    """
+    with tempfile.TemporaryDirectory(prefix="silentcut_") as tmp_dir:
+        tmp = Path(tmp_dir)
+        part_paths = [tmp / f"part_{i}.mp4"
+                      for i in range(len(speech_segments))]
+
+        async def encode_all() -> None:
+            # Each encode already uses several x264 threads, so cap the
+            # number of concurrent processes at half the cores.
+            semaphore = asyncio.Semaphore(max(1, (os.cpu_count() or 2) // 2))
+            await asyncio.gather(*(
+                _encode_segment(input_path, seg, str(part_paths[i]),
+                                fluid, semaphore)
+                for i, seg in enumerate(speech_segments)
+            ))
+
+        asyncio.run(encode_all())
+        _concat_parts(tmp, part_paths, output_path)
 
 
 def cut_and_concat(
@@ -9,7 +190,8 @@ def cut_and_concat(
     output_path: str,
     speech_segments: list[Segment],
     fluid: bool = False,
-    dry_run: bool = False
+    dry_run: bool = False,
+    total_duration: float | None = None
 ) -> None:
     """
     Slices and concatenates speech segments from the input video.
@@ -24,76 +206,37 @@ def cut_and_concat(
             f"[dim]Dry run: Would cut {len(speech_segments)} segments...[/dim]")
         return
 
+    if total_duration is None:
+        total_duration = speech_segments[-1].end
+
     try:
-        # Build the filter complex string
-        v_segments = []
-        a_segments = []
-
-        for i, seg in enumerate(speech_segments):
-            # Speed adjustments
-            v_speed = 1.0 / seg.speed_factor
-
-            # atempo filter has a limit of [0.5, 2.0]
-            # We chain multiple atempo filters if factor > 2.0
-            a_speed_filters = []
-            temp_factor = seg.speed_factor
-            while temp_factor > 2.0:
-                a_speed_filters.append("atempo=2.0")
-                temp_factor /= 2.0
-            if temp_factor != 1.0:
-                a_speed_filters.append(f"atempo={temp_factor:.2f}")
-
-            a_filter_str = ",".join(a_speed_filters) if a_speed_filters else ""
-            if a_filter_str:
-                a_filter_str = "," + a_filter_str
-
-            # Video filters
-            v_filters = [
-                f"trim=start={seg.start}:end={seg.end}", f"setpts={v_speed:.4f}*PTS-STARTPTS"]
-            if fluid and seg.speed_factor > 1.05:
-                # Add motion blur via frame blending
-                # tmix merges 'frames' consecutive frames. 3 is a good balance.
-                v_filters.append("tmix=frames=3:weights='1 1 1'")
-
-            v_filter_str = ",".join(v_filters)
-
-            # Video segment
-            v_segments.append(
-                f"[0:v]{v_filter_str}[v{i}];")
-
-            # Audio segment
-            a_segments.append(
-                f"[0:a]atrim=start={seg.start}:end={seg.end},asetpts=PTS-STARTPTS{a_filter_str}[a{i}];")
-
-        concat_inputs = "".join(
-            [f"[v{i}][a{i}]" for i in range(len(speech_segments))])
-        concat_filter = f"{concat_inputs}concat=n={len(speech_segments)}:v=1:a=1[outv][outa]"
-
-        filter_complex = "".join(v_segments) + \
-            "".join(a_segments) + concat_filter
-
-        # Run FFmpeg with filter_complex
-        # We use ultrafast preset to keep it as fast as possible.
-        # CRF 20 provides high quality (better than default 23).
-        subprocess.run(
-            [
-                "ffmpeg",
-                "-y",
-                "-i", input_path,
-                "-filter_complex", filter_complex,
-                "-map", "[outv]",
-                "-map", "[outa]",
-                "-c:v", "libx264",
-                "-preset", "ultrafast",
-                "-crf", "20",
-                "-c:a", "aac",
-                "-b:a", "192k",
-                output_path
-            ],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            check=True
-        )
+        # A single segment spanning the whole file (nothing detected to
+        # cut) needs no cutting at all — just remux with stream copy.
+        if (len(speech_segments) == 1
+                and speech_segments[0].speed_factor == 1.0
+                and speech_segments[0].start <= 0.01
+                and total_duration - speech_segments[0].end < 0.05):
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-y",
+                    "-i", input_path,
+                    "-c", "copy",
+                    output_path
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True
+            )
+            return
+
+        # When no segment needs a speed change we can cut losslessly with
+        # stream copy + concat demuxer instead of re-encoding through x264.
+        if all(seg.speed_factor == 1.0 for seg in speech_segments):
+            _cut_and_concat_copy(input_path, output_path, speech_segments)
+            return
+
+        _cut_and_concat_encode(
+            input_path, output_path, speech_segments, fluid)
     except subprocess.CalledProcessError as e:
-        from silentcut.utils import handle_error
         handle_error("Failed during video cutting and concatenation phase", e)
@@ -1,7 +1,33 @@
+import os
 import re
-import ffmpeg  # type: ignore
-from typing import Protocol
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Protocol
+from silentcut import cache
 from silentcut.models import Segment, SilenceConfig
+from silentcut.utils import handle_error
+
+# Matches: silencedetect: silence_start: 1.50
+#          silencedetect: silence_end: 3.20 | silence_duration: 1.70
+# A single fused alternation so each line needs only one regex pass.
+_SILENCE_EVENT_RE = re.compile(r'silence_(start|end):\s+([\d\.]+)')
+
+# Matches the input header ffmpeg prints on every run:
+#   Duration: 00:06:40.00, start: 0.000000, bitrate: ...
+_DURATION_RE = re.compile(r'Duration:\s+(\d+):(\d+):([\d\.]+)')
+
+# Matches the volumedetect summary: mean_volume: -23.5 dB
+_MEAN_VOLUME_RE = re.compile(r'mean_volume:\s+(-?[\d\.]+)\s+dB')
+
+
+def _silence_filter(config: SilenceConfig) -> str:
+    """Build the -af chain for silence detection from the config."""
+    base = f"silencedetect=noise={config.threshold}dB:d={config.min_duration}"
+    if config.mono:
+        # Halve the per-sample comparison work by scanning a mono mix
+        return "aformat=channel_layouts=mono," + base
+    return base
 
 
 class BaseDetector(Protocol):
@@ -10,61 +36,323 @@ class BaseDetector(Protocol):
 
 
 class FFmpegDetector:
-    def detect(self, input_path: str, config: SilenceConfig) -> list[Segment]:
-        """Run FFmpeg silencedetect and extract silent segments."""
-        try:
-            _, stderr = (
-                ffmpeg
-                .input(input_path)
-                .filter('silencedetect', noise=f"{config.threshold}dB", d=config.min_duration)
-                .output('pipe:', format='null')
-                .run(capture_stdout=True, capture_stderr=True)
-            )
-            return self._parse_silence_stderr(stderr.decode('utf-8'))
-        except ffmpeg.Error as e:
-            from silentcut.utils import handle_error
-            handle_error("Failed during silence detection phase", e)
+    # Two silences this close to a chunk boundary are treated as one
+    # silence that was split by the parallel chunking.
+    _STITCH_EPSILON = 0.1
+
+    # Recent stderr lines kept while streaming, so a failed run can
+    # still show ffmpeg's actual complaint in the error report.
+    _TAIL_LINES = 20
+
+    def __init__(self) -> None:
+        # Total input duration harvested from the last detect() pass, so
+        # callers can skip a separate ffprobe round-trip.
+        self.last_duration: float | None = None
+        self._stderr_tail: deque[str] = deque(maxlen=self._TAIL_LINES)
+
+    def detect(self, input_path: str, config: SilenceConfig,
+               workers: int = 1) -> list[Segment]:
+        """Run FFmpeg silencedetect and extract silent segments.
+
+        The stderr stream is parsed line-by-line as ffmpeg produces it, so
+        we never buffer the full (potentially huge) log in memory.
+
+        With workers > 1 the input is split into equal time ranges that
+        are scanned concurrently (silencedetect is CPU-bound, and the
+        subprocesses release the GIL). Silences straddling a chunk
+        boundary are stitched back together, though ones shorter than
+        min_duration on both sides of a boundary can be missed.
+        """
+        self.last_duration = None
+        if workers != 1:
+            return self._detect_parallel(input_path, config, workers)
+
+        proc = subprocess.Popen(
+            [
+                "ffmpeg",
+                "-nostdin",
+                "-i", input_path,
+                "-af", _silence_filter(config),
+                "-f", "null", "-"
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            bufsize=1
+        )
+        assert proc.stderr is not None
+        segments = self._parse_silence_lines(
+            self._capture_duration(proc.stderr))
+        proc.stderr.close()
+
+        returncode = proc.wait()
+        if returncode != 0:
+            handle_error(
+                "Failed during silence detection phase",
+                subprocess.CalledProcessError(
+                    returncode, "ffmpeg",
+                    stderr="".join(self._stderr_tail)))
+            return []
+        return segments
+
+    def _detect_parallel(self, input_path: str, config: SilenceConfig,
+                         workers: int) -> list[Segment]:
+        """Split the input into time chunks and scan them concurrently."""
+        from silentcut.processor import get_video_duration
+
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+
+        total_duration = get_video_duration(input_path)
+        if total_duration <= 0 or workers == 1:
+            return self.detect(input_path, config)
+        self.last_duration = total_duration
+
+        chunk_len = total_duration / workers
+        bounds = [(i * chunk_len, min((i + 1) * chunk_len, total_duration))
+                  for i in range(workers)]
+        return self._detect_ranges(input_path, config, bounds)
+
+    def detect_sampled(self, input_path: str, config: SilenceConfig,
+                       windows: int) -> list[Segment]:
+        """Approximate detection from equally spaced sample windows.
+
+        Scans only up to 10 seconds at the start of each of the N
+        windows, trading accuracy for near-constant preview time on long
+        inputs. Silence outside the sampled ranges is not detected.
+        """
+        from silentcut.processor import get_video_duration
+
+        total_duration = get_video_duration(input_path)
+        step = total_duration / windows if windows > 0 else 0.0
+        if total_duration <= 0 or windows <= 1 or step <= 10.0:
+            return self.detect(input_path, config)
+        self.last_duration = total_duration
+
+        bounds = [(i * step, i * step + 10.0) for i in range(windows)]
+        return self._detect_ranges(input_path, config, bounds)
+
+    def _detect_ranges(self, input_path: str, config: SilenceConfig,
+                       bounds: list[tuple[float, float]]) -> list[Segment]:
+        """Scan the given time ranges concurrently and merge the results,
+        fusing silences that were split by a range boundary."""
+        with ThreadPoolExecutor(max_workers=len(bounds)) as pool:
+            chunk_results = list(pool.map(
+                lambda b: self._detect_chunk(input_path, b[0], b[1], config),
+                bounds))
+
+        segments: list[Segment] = []
+        prev_bound_end: float | None = None
+        for (start, end), chunk in zip(bounds, chunk_results):
+            for i, seg in enumerate(chunk):
+                # Fuse only across a range boundary: the ranges must be
+                # contiguous, the previous range's last silence must have
+                # run into its end bound and this range's first must begin
+                # right at its start. Gaps between silences inside one
+                # range are genuine speech, however short.
+                if (i == 0
+                        and segments
+                        and prev_bound_end is not None
+                        and start - prev_bound_end < self._STITCH_EPSILON
+                        and prev_bound_end - segments[-1].end
+                        < self._STITCH_EPSILON
+                        and seg.start - start < self._STITCH_EPSILON):
+                    segments[-1] = Segment(start=segments[-1].start,
+                                           end=seg.end)
+                else:
+                    segments.append(seg)
+            prev_bound_end = end
+        return segments
+
+    def _detect_chunk(self, input_path: str, start: float, end: float,
+                      config: SilenceConfig) -> list[Segment]:
+        """Run silencedetect on [start, end) and rebase times to the file."""
+        proc = subprocess.run(
+            [
+                "ffmpeg",
+                "-nostdin",
+                "-ss", str(start),
+                "-to", str(end),
+                "-i", input_path,
+                "-af", _silence_filter(config),
+                "-f", "null", "-"
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace"
+        )
+        if proc.returncode != 0:
+            handle_error(
+                "Failed during silence detection phase",
+                subprocess.CalledProcessError(
+                    proc.returncode, "ffmpeg",
+                    stderr="".join(proc.stderr.splitlines(keepends=True)
+                                   [-self._TAIL_LINES:])))
             return []
 
-    def detect_mean_volume(self, input_path: str) -> float:
-        """Detect the mean volume of the audio stream in dB."""
-        try:
-            _, stderr = (
-                ffmpeg
-                .input(input_path)
-                .filter('volumedetect')
-                .output('pipe:', format='null')
-                .run(capture_stdout=True, capture_stderr=True)
-            )
-            output = stderr.decode('utf-8')
-            match = re.search(r'mean_volume:\s+(-?[\d\.]+)\s+dB', output)
+        segments: list[Segment] = []
+        current_start: float | None = None
+        for line in proc.stderr.splitlines():
+            match = _SILENCE_EVENT_RE.search(line)
+            if not match:
+                continue
+            if match.group(1) == 'start':
+                current_start = float(match.group(2))
+            elif current_start is not None:
+                segments.append(Segment(start=start + current_start,
+                                        end=start + float(match.group(2))))
+                current_start = None
+
+        # A silence still open at EOF straddles the chunk boundary; close
+        # it at the boundary so the merge step can stitch it.
+        if current_start is not None:
+            segments.append(Segment(start=start + current_start, end=end))
+        return segments
+
+    def detect_with_volume(
+        self, input_path: str, config: SilenceConfig
+    ) -> tuple[list[Segment], float]:
+        """Run volumedetect and silencedetect in one decode pass.
+
+        Returns the silent segments for config's threshold together with
+        the mean volume in dB, so the --auto path only needs a second
+        detection pass when the auto threshold differs materially from
+        the tentative one.
+        """
+        self.last_duration = None
+        proc = subprocess.Popen(
+            [
+                "ffmpeg",
+                "-nostdin",
+                "-i", input_path,
+                "-af", "volumedetect," + _silence_filter(config),
+                "-f", "null", "-"
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            bufsize=1
+        )
+        assert proc.stderr is not None
+
+        segments: list[Segment] = []
+        mean_volume: float | None = None
+        current_start: float | None = None
+
+        for line in self._capture_duration(proc.stderr):
+            match = _SILENCE_EVENT_RE.search(line)
+            if match:
+                if match.group(1) == 'start':
+                    current_start = float(match.group(2))
+                elif current_start is not None:
+                    segments.append(Segment(start=current_start,
+                                            end=float(match.group(2))))
+                    current_start = None
+                continue
+
+            volume_match = _MEAN_VOLUME_RE.search(line)
+            if volume_match:
+                mean_volume = float(volume_match.group(1))
+        proc.stderr.close()
+
+        returncode = proc.wait()
+        if returncode != 0:
+            handle_error(
+                "Failed during silence detection phase",
+                subprocess.CalledProcessError(
+                    returncode, "ffmpeg",
+                    stderr="".join(self._stderr_tail)))
+            return [], -20.0
+
+        # Safe fallback if volumedetect output could not be parsed
+        return segments, mean_volume if mean_volume is not None else -20.0
+
+    def detect_mean_volume(self, input_path: str,
+                           sample_duration: float | None = None) -> float:
+        """Detect the mean volume of the audio stream in dB.
+
+        With sample_duration set, only that many leading seconds are
+        decoded — enough to estimate a noise floor without a full pass.
+        """
+        cached = cache.get("mean_volume", input_path)
+        if sample_duration is None and cached is not None:
+            return cached
+
+        limit = ["-t", str(sample_duration)] if sample_duration else []
+        proc = subprocess.run(
+            [
+                "ffmpeg",
+                "-nostdin",
+                *limit,
+                "-i", input_path,
+                "-af", "volumedetect",
+                "-f", "null", "-"
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace"
+        )
+        if proc.returncode == 0:
+            match = _MEAN_VOLUME_RE.search(proc.stderr)
             if match:
-                return float(match.group(1))
-            return -20.0  # Safe fallback if parsing fails
-        except ffmpeg.Error:
-            return -20.0
+                mean_volume = float(match.group(1))
+                if sample_duration is None:
+                    # Sampled readings are approximate; only cache full ones
+                    cache.put("mean_volume", input_path, mean_volume)
+                return mean_volume
+        return -20.0  # Safe fallback if the run or parsing fails
+
+    def _capture_duration(self, lines: Iterable[str]) -> Iterable[str]:
+        """Pass lines through, harvesting the Duration header on the way."""
+        self._stderr_tail.clear()
+        for line in lines:
+            self._stderr_tail.append(line)
+            if self.last_duration is None:
+                match = _DURATION_RE.search(line)
+                if match:
+                    h, m, s = match.groups()
+                    self.last_duration = (
+                        int(h) * 3600 + int(m) * 60 + float(s))
+            yield line
 
     def _parse_silence_stderr(self, stderr: str) -> list[Segment]:
-        """Extract silence start and end times from FFmpeg stderr logging."""
+        """Extract silence start and end times from FFmpeg stderr logging.
+
+        Scans the whole buffer with one finditer pass instead of
+        splitting into lines and matching each one.
+        """
         segments: list[Segment] = []
+        current_start: float | None = None
+
+        for match in _SILENCE_EVENT_RE.finditer(stderr):
+            if match.group(1) == 'start':
+                current_start = float(match.group(2))
+            elif current_start is not None:
+                segments.append(
+                    Segment(start=current_start, end=float(match.group(2))))
+                current_start = None
 
-        # Matches: silencedetect: silence_start: 1.50
-        start_pattern = re.compile(r'silence_start:\s+([\d\.]+)')
-        # Matches: silencedetect: silence_end: 3.20 | silence_duration: 1.70
-        end_pattern = re.compile(r'silence_end:\s+([\d\.]+)')
+        return segments
 
+    def _parse_silence_lines(self, lines: Iterable[str]) -> list[Segment]:
+        """Incrementally extract silent segments from stderr lines."""
+        segments: list[Segment] = []
         current_start: float | None = None
 
-        for line in stderr.splitlines():
-            if 'silencedetect' in line:
-                start_match = start_pattern.search(line)
-                end_match = end_pattern.search(line)
+        for line in lines:
+            match = _SILENCE_EVENT_RE.search(line)
+            if not match:
+                continue
 
-                if start_match:
-                    current_start = float(start_match.group(1))
-                elif end_match and current_start is not None:
-                    end_time = float(end_match.group(1))
-                    segments.append(Segment(start=current_start, end=end_time))
-                    current_start = None
+            if match.group(1) == 'start':
+                current_start = float(match.group(2))
+            elif current_start is not None:
+                segments.append(
+                    Segment(start=current_start, end=float(match.group(2))))
+                current_start = None
 
         return segments
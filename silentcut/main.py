@@ -1,11 +1,11 @@
 import os
+from dataclasses import replace
 from pathlib import Path
 import typer
-from pydantic import ValidationError
-from rich.table import Table
 
+from silentcut import cache
 from silentcut.models import SilenceConfig
-from silentcut.utils import console, format_time, ensure_ffmpeg, handle_error, get_unique_path
+from silentcut.utils import format_time, ensure_ffmpeg, handle_error, get_unique_path
 from silentcut.detector import FFmpegDetector
 from silentcut.processor import get_video_duration, build_timeline
 from silentcut.cutter import cut_and_concat
@@ -60,6 +60,16 @@ def remove(
         "--fluid", "-f",
         help="Enable smooth transitions and motion blur for speed changes."
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers", "-w",
+        help="Parallel silence-detection workers (0 = all cores)."
+    ),
+    preview_windows: int = typer.Option(
+        None,
+        "--preview-windows",
+        help="Approximate detection from N sample windows (fast preview)."
+    ),
     verbose: bool = typer.Option(
         False,
         "--verbose", "-v",
@@ -69,9 +79,25 @@ def remove(
         False,
         "--dry-run",
         help="Detect only, do not write output."
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Do not reuse cached probe results for this input."
     )
 ) -> None:
     """Remove silence from an mp4 file."""
+    # Resolved here rather than at module import so that `--help` and
+    # module imports never construct the Console or load rich.
+    from silentcut.utils import console
+
+    # CLI runs can exit without interpreter teardown on errors; see
+    # handle_error. setdefault lets the environment (and the test suite)
+    # force it off.
+    os.environ.setdefault("SILENTCUT_FAST_EXIT", "1")
+
+    if no_cache:
+        cache.disable()
     ensure_ffmpeg()
 
     # Determine default output if not provided
@@ -85,12 +111,35 @@ def remove(
     if not dry_run:
         output_path = get_unique_path(output_path)
 
-    # Auto threshold detection
-    resolved_threshold = threshold
+    try:
+        config = SilenceConfig(
+            threshold=threshold,
+            min_duration=min_duration,
+            padding=padding,
+            accelerate=accelerate,
+            fluid=fluid
+        )
+    except ValueError as e:
+        handle_error("Invalid configuration parameters provided.", e)
+        return
+
+    # One detector instance shared by the auto pass and Phase 1
+    detector = FFmpegDetector()
+
+    # Auto threshold detection: run volumedetect and silencedetect fused
+    # in a single decode pass with the tentative threshold, and keep its
+    # silences when the auto threshold lands close enough to reuse them.
+    pre_detected = None
     if auto_threshold:
         with console.status("[bold magenta]Analyzing noise floor...") as status:
-            d = FFmpegDetector()
-            mean_vol = d.detect_mean_volume(str(input_file))
+            if preview_windows:
+                # Preview mode: a short sample is enough for the noise floor
+                silences = None
+                mean_vol = detector.detect_mean_volume(
+                    str(input_file), sample_duration=10.0)
+            else:
+                silences, mean_vol = detector.detect_with_volume(
+                    str(input_file), config)
             # Heuristic: set threshold slightly above mean volume (noise floor)
             # Typically, silence is around mean_volume, speech is significantly above.
             resolved_threshold = round(mean_vol + 2.0, 1)
@@ -99,19 +148,14 @@ def remove(
             console.print(
                 f"[magenta]ℹ[/magenta] Detected noise floor at {mean_vol} dB. Auto-setting threshold to [bold]{resolved_threshold} dB[/bold].")
 
-    try:
-        config = SilenceConfig(
-            threshold=resolved_threshold,
-            min_duration=min_duration,
-            padding=padding,
-            accelerate=accelerate,
-            fluid=fluid
-        )
-    except ValidationError as e:
-        handle_error("Invalid configuration parameters provided.", e)
-        return
+            if (silences is not None
+                    and abs(resolved_threshold - config.threshold) <= 1.0):
+                pre_detected = silences
+            config = replace(config, threshold=resolved_threshold)
 
-    # Print startup panel
+    # Print startup panel. Table is only needed once a run actually
+    # starts, so import it here instead of at module load.
+    from rich.table import Table
     table = Table(title="SilentCut Configuration",
                   show_header=True, header_style="bold magenta")
     table.add_column("Parameter")
@@ -130,9 +174,18 @@ def remove(
 
     # Phase 1: Detection
     with console.status("[bold green]Detecting silence (Phase 1/2)...") as status:
-        detector = FFmpegDetector()
-        silent_segments = detector.detect(str(input_file), config)
-        total_duration = get_video_duration(str(input_file))
+        if pre_detected is not None:
+            silent_segments = pre_detected
+        elif preview_windows:
+            silent_segments = detector.detect_sampled(
+                str(input_file), config, windows=preview_windows)
+        else:
+            silent_segments = detector.detect(
+                str(input_file), config, workers=workers)
+        # The detect pass already saw the container header, so reuse its
+        # duration and only fall back to a separate ffprobe if missing.
+        total_duration = detector.last_duration or get_video_duration(
+            str(input_file))
 
         if total_duration <= 0:
             handle_error("Could not determine total video duration.")
@@ -140,6 +193,10 @@ def remove(
     console.print(
         f"[green]✓[/green] Found {len(silent_segments)} silent segments in a {format_time(total_duration)} video.")
 
+    if preview_windows:
+        console.print(
+            "[yellow]⚠ Preview mode: detection is approximate (sampled windows only).[/yellow]")
+
     if len(silent_segments) == 0:
         console.print(
             "[yellow]⚠ No silence detected. Try increasing the threshold (e.g. -t -25) or using --auto.[/yellow]")
@@ -173,7 +230,8 @@ def remove(
     # Phase 2: Cutting
     with console.status(f"[bold blue]Processing {len(segments_to_process)} segments (Phase 2/2)...") as status:
         cut_and_concat(str(input_file), str(output_path),
-                       segments_to_process, fluid=config.fluid, dry_run=dry_run)
+                       segments_to_process, fluid=config.fluid,
+                       dry_run=dry_run, total_duration=total_duration)
 
     # Summary
     if not dry_run:
@@ -1,16 +1,125 @@
-import ffmpeg  # type: ignore
+import os
+import subprocess
+
+import numpy as np
+from silentcut import cache
 from silentcut.models import Segment, SilenceConfig
+from silentcut.utils import handle_error
+
+# Below this many silences the scalar loop beats NumPy's setup overhead.
+_VECTORIZE_MIN_SILENCES = 32
+
+# numba is an optional accelerator, not a dependency: when present, the
+# overlap merge runs as a compiled single sweep instead of chained array
+# ops that allocate intermediates.
+try:
+    from numba import njit  # type: ignore
+except ImportError:
+    njit = None
+
+
+def _merge_overlaps(
+    starts: np.ndarray, ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merge overlapping intervals; inputs must be sorted by start."""
+    if _merge_overlaps_jit is not None:
+        return _merge_overlaps_jit(starts, ends)
+
+    # A new group begins wherever an interval starts after the running
+    # maximum end of everything before it.
+    running_ends = np.maximum.accumulate(ends)
+    new_group = np.empty(starts.size, dtype=np.bool_)
+    new_group[0] = True
+    new_group[1:] = starts[1:] > running_ends[:-1]
+
+    group_first = np.flatnonzero(new_group)
+    group_last = np.concatenate((group_first[1:] - 1, (starts.size - 1,)))
+    return starts[group_first], running_ends[group_last]
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _merge_overlaps_jit(starts, ends):  # pragma: no cover
+        out_starts = np.empty_like(starts)
+        out_ends = np.empty_like(ends)
+        count = 0
+        cur_start = starts[0]
+        cur_end = ends[0]
+        for i in range(1, starts.size):
+            if starts[i] <= cur_end:
+                if ends[i] > cur_end:
+                    cur_end = ends[i]
+            else:
+                out_starts[count] = cur_start
+                out_ends[count] = cur_end
+                count += 1
+                cur_start = starts[i]
+                cur_end = ends[i]
+        out_starts[count] = cur_start
+        out_ends[count] = cur_end
+        count += 1
+        return out_starts[:count], out_ends[:count]
+else:
+    _merge_overlaps_jit = None
+
+# In-process duration memo: repeated probes of the same unchanged file
+# (CLI phases, parallel detection, tests sharing a fixture) skip even the
+# persistent-cache bookkeeping. mtime+size in the key handle invalidation.
+_duration_cache: dict[tuple[str, int, int], float] = {}
 
 
 def get_video_duration(input_path: str) -> float:
     """Extract total duration of the video in seconds."""
     try:
-        probe = ffmpeg.probe(input_path)
-        # Attempt to get precise duration from format
-        duration = float(probe['format']['duration'])
+        stat = os.stat(input_path)
+        key = (input_path, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        key = None
+
+    if key is not None and key in _duration_cache:
+        return _duration_cache[key]
+
+    cached = cache.get("duration", input_path)
+    if cached is not None:
+        if key is not None:
+            _duration_cache[key] = cached
+        return cached
+
+    def probe(read_bounded: bool, timeout: float) -> float:
+        # Ask ffprobe for just the container duration: cheaper than a
+        # full probe, and no JSON to materialize and parse. The bounded
+        # variant scans only the first packet interval so malformed or
+        # network-backed inputs cannot stall the probe.
+        intervals = ["-read_intervals", "%+#1"] if read_bounded else []
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v", "error",
+                *intervals,
+                "-show_entries", "format=duration",
+                "-of", "default=nw=1:nk=1",
+                input_path
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=timeout
+        )
+        return float(result.stdout.strip())
+
+    try:
+        try:
+            duration = probe(read_bounded=True, timeout=10)
+        except (subprocess.TimeoutExpired, ValueError):
+            # The short scan found no duration (e.g. a container that
+            # needs a deeper read) — retry once without the read bound.
+            duration = probe(read_bounded=False, timeout=30)
+        if key is not None:
+            _duration_cache[key] = duration
+        cache.put("duration", input_path, duration)
         return duration
-    except (ffmpeg.Error, KeyError, ValueError) as e:
-        from silentcut.utils import handle_error
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired,
+            FileNotFoundError, ValueError) as e:
         handle_error(f"Cannot probe duration for {input_path}", e)
         return 0.0
 
@@ -24,43 +133,181 @@ def calculate_speech_segments(
     Invert silent segments to obtain the speech parts.
     Applies padding and ensures boundaries are kept.
     """
+    if not silent_segments:
+        # Nothing detected: the whole file is speech (unless it is
+        # practically empty), with no sweep needed.
+        if total_duration > 0.05:
+            return [Segment(start=0.0, end=total_duration)]
+        return []
+
+    if len(silent_segments) >= _VECTORIZE_MIN_SILENCES:
+        return _calculate_speech_segments_vectorized(
+            silent_segments, total_duration, config)
+
+    # Padded bounds and overlap consolidation run fused in one sweep:
+    # (cur_start, cur_end) holds the chunk being grown, and a Segment is
+    # only materialized once it can no longer be extended. Inline
+    # conditionals instead of max()/min() save a C function call with
+    # type dispatch per bound.
     speech_segments: list[Segment] = []
     current_time = 0.0
+    pad = config.padding
+    cur_start: float | None = None
+    cur_end = 0.0
 
     for silence in silent_segments:
-        # Determine the safe bounds for the speech chunk preceding this silence
-        speech_start = max(0.0, current_time - config.padding)
-        speech_end = min(total_duration, silence.start + config.padding)
+        speech_start = current_time - pad
+        if speech_start < 0.0:
+            speech_start = 0.0
+        speech_end = silence.start + pad
+        if speech_end > total_duration:
+            speech_end = total_duration
+        current_time = silence.end
+
+        if speech_start >= speech_end:
+            continue
+        if cur_start is None:
+            cur_start, cur_end = speech_start, speech_end
+        elif speech_start <= cur_end:
+            if speech_end > cur_end:
+                cur_end = speech_end
+        else:
+            speech_segments.append(Segment(start=cur_start, end=cur_end))
+            cur_start, cur_end = speech_start, speech_end
+
+    # Final chunk after the last silence, unless practically empty
+    final_start = current_time - pad
+    if final_start < 0.0:
+        final_start = 0.0
+    if total_duration - final_start > 0.05:
+        if cur_start is None:
+            cur_start, cur_end = final_start, total_duration
+        elif final_start <= cur_end:
+            cur_end = total_duration
+        else:
+            speech_segments.append(Segment(start=cur_start, end=cur_end))
+            cur_start, cur_end = final_start, total_duration
+
+    if cur_start is not None:
+        speech_segments.append(Segment(start=cur_start, end=cur_end))
+
+    return speech_segments
+
+
+def _calculate_speech_segments_vectorized(
+    silent_segments: list[Segment],
+    total_duration: float,
+    config: SilenceConfig
+) -> list[Segment]:
+    """NumPy version of calculate_speech_segments for large silence counts.
+
+    Computes padded speech bounds and the overlap consolidation as array
+    ops, materializing Segment objects only for the final result.
+    """
+    n = len(silent_segments)
+    s_starts = np.fromiter(
+        (s.start for s in silent_segments), dtype=np.float64, count=n)
+    s_ends = np.fromiter(
+        (s.end for s in silent_segments), dtype=np.float64, count=n)
+
+    # Speech chunk i runs from the end of silence i-1 (start of file for
+    # i=0) to the start of silence i (end of file for the final chunk),
+    # widened by the padding and clamped to the file bounds.
+    pad = config.padding
+    speech_starts = np.maximum(
+        0.0, np.concatenate(((0.0,), s_ends)) - pad)
+    speech_ends = np.minimum(
+        total_duration,
+        np.concatenate((s_starts + pad, (total_duration,))))
+
+    keep = speech_starts < speech_ends
+    # The final chunk is dropped when practically empty.
+    keep[-1] = speech_ends[-1] - speech_starts[-1] > 0.05
+    speech_starts = speech_starts[keep]
+    speech_ends = speech_ends[keep]
+
+    if speech_starts.size == 0:
+        return []
+
+    merged_starts, merged_ends = _merge_overlaps(speech_starts, speech_ends)
+    return [
+        Segment(start=float(a), end=float(b))
+        for a, b in zip(merged_starts, merged_ends)
+    ]
+
+
+def _coalesce(segments: list[Segment], gap_eps: float = 0.05) -> list[Segment]:
+    """
+    Merge adjacent or near-adjacent segments that share a speed factor.
+    Every segment becomes its own node in cut_and_concat's ffmpeg work,
+    so collapsing same-speed neighbours shrinks the graph directly.
+    """
+    if not segments:
+        return segments
+
+    merged = [segments[0]]
+    for seg in segments[1:]:
+        prev = merged[-1]
+        if (seg.start - prev.end <= gap_eps
+                and seg.speed_factor == prev.speed_factor):
+            merged[-1] = Segment(start=prev.start,
+                                 end=max(prev.end, seg.end),
+                                 speed_factor=prev.speed_factor)
+        else:
+            merged.append(seg)
+    return merged
 
-        if speech_start < speech_end:
-            speech_segments.append(Segment(start=speech_start, end=speech_end))
 
+def _iter_speech_chunks(
+    silent_segments: list[Segment],
+    total_duration: float,
+    config: SilenceConfig
+):
+    """
+    Yield consolidated (start, end) speech bounds in one linear sweep.
+    Generator counterpart of calculate_speech_segments, used by the
+    accelerate path so no intermediate segment list is materialized.
+    """
+    pad = config.padding
+    cur_start: float | None = None
+    cur_end = 0.0
+    current_time = 0.0
+
+    for silence in silent_segments:
+        speech_start = current_time - pad
+        if speech_start < 0.0:
+            speech_start = 0.0
+        speech_end = silence.start + pad
+        if speech_end > total_duration:
+            speech_end = total_duration
         current_time = silence.end
 
-    # Handle the final chunk after the last silence
-    final_start = max(0.0, current_time - config.padding)
-    final_end = total_duration
-
-    if final_start < final_end:
-        # Check if the final chunk is practically empty
-        if final_end - final_start > 0.05:
-            speech_segments.append(Segment(start=final_start, end=final_end))
-
-    # Remove overlapping overlaps if large padding is causing it
-    # We consolidate overlapping segments
-    consolidated: list[Segment] = []
-    for s in speech_segments:
-        if not consolidated:
-            consolidated.append(s)
+        if speech_start >= speech_end:
+            continue
+        if cur_start is None:
+            cur_start, cur_end = speech_start, speech_end
+        elif speech_start <= cur_end:
+            if speech_end > cur_end:
+                cur_end = speech_end
         else:
-            prev = consolidated[-1]
-            if s.start <= prev.end:
-                consolidated[-1] = Segment(start=prev.start,
-                                           end=max(prev.end, s.end))
-            else:
-                consolidated.append(s)
+            yield cur_start, cur_end
+            cur_start, cur_end = speech_start, speech_end
+
+    # Final chunk after the last silence, unless practically empty
+    final_start = current_time - pad
+    if final_start < 0.0:
+        final_start = 0.0
+    if total_duration - final_start > 0.05:
+        if cur_start is None:
+            cur_start, cur_end = final_start, total_duration
+        elif final_start <= cur_end:
+            cur_end = total_duration
+        else:
+            yield cur_start, cur_end
+            cur_start, cur_end = final_start, total_duration
 
-    return consolidated
+    if cur_start is not None:
+        yield cur_start, cur_end
 
 
 def build_timeline(
@@ -73,84 +320,92 @@ def build_timeline(
     If config.accelerate is set, includes silence segments with a speed factor.
     Otherwise, only includes speech segments (removing silence).
     """
-    speech_segments = calculate_speech_segments(
-        silent_segments, total_duration, config)
+    if not silent_segments:
+        # No silence means no cutting or speed changes either way; one
+        # full-file segment lets cut_and_concat take its remux fast path.
+        if total_duration > 0.05:
+            return [Segment(start=0.0, end=total_duration)]
+        return []
 
     if not config.accelerate:
-        return speech_segments
+        return _coalesce(calculate_speech_segments(
+            silent_segments, total_duration, config))
 
-    # Interleave speech and accelerated silence
+    # Interleave speech and accelerated silence in a single fused sweep:
+    # the consolidated speech chunks stream straight from the generator.
     timeline: list[Segment] = []
     current_time = 0.0
     RAMP_DURATION = 0.1  # seconds for ease-in/out
 
-    # Ensure speech segments are sorted
-    for speech in speech_segments:
+    # Loop invariants hoisted to locals: LOAD_FAST instead of repeated
+    # attribute lookups and a float division per iteration.
+    accelerate = config.accelerate
+    fluid = config.fluid
+    mid_speed = (1.0 + accelerate) / 2.0
+    ramp_pair = RAMP_DURATION * 2
+
+    # Each iteration builds its 1-4 segments as one tuple and extends the
+    # timeline once, instead of up to four separate append calls.
+    for chunk_start, chunk_end in _iter_speech_chunks(
+            silent_segments, total_duration, config):
+        speech = Segment(start=chunk_start, end=chunk_end)
         # Gap before speech (silence)
         if speech.start > current_time + 0.01:
             silence_duration = speech.start - current_time
 
-            if config.fluid and silence_duration > RAMP_DURATION * 2:
+            if fluid and silence_duration > ramp_pair:
                 # Speed ramping: Ease-in -> Constant -> Ease-out
-                mid_speed = (1.0 + config.accelerate) / 2.0
-
-                # Ease-in
-                timeline.append(Segment(
-                    start=current_time,
-                    end=current_time + RAMP_DURATION,
-                    speed_factor=mid_speed
-                ))
-                # Constant
-                timeline.append(Segment(
-                    start=current_time + RAMP_DURATION,
-                    end=speech.start - RAMP_DURATION,
-                    speed_factor=config.accelerate
-                ))
-                # Ease-out
-                timeline.append(Segment(
-                    start=speech.start - RAMP_DURATION,
-                    end=speech.start,
-                    speed_factor=mid_speed
-                ))
-            elif config.fluid:
+                chunk: tuple[Segment, ...] = (
+                    Segment(start=current_time,
+                            end=current_time + RAMP_DURATION,
+                            speed_factor=mid_speed),
+                    Segment(start=current_time + RAMP_DURATION,
+                            end=speech.start - RAMP_DURATION,
+                            speed_factor=accelerate),
+                    Segment(start=speech.start - RAMP_DURATION,
+                            end=speech.start,
+                            speed_factor=mid_speed),
+                    speech
+                )
+            elif fluid:
                 # Short silence: just mid speed
-                timeline.append(Segment(
-                    start=current_time,
-                    end=speech.start,
-                    speed_factor=(1.0 + config.accelerate) / 2.0
-                ))
+                chunk = (
+                    Segment(start=current_time,
+                            end=speech.start,
+                            speed_factor=mid_speed),
+                    speech
+                )
             else:
                 # Standard acceleration (jump)
-                timeline.append(Segment(
-                    start=current_time,
-                    end=speech.start,
-                    speed_factor=config.accelerate
-                ))
-
-        # The speech itself
-        timeline.append(speech)
+                chunk = (
+                    Segment(start=current_time,
+                            end=speech.start,
+                            speed_factor=accelerate),
+                    speech
+                )
+        else:
+            chunk = (speech,)
+
+        timeline.extend(chunk)
         current_time = speech.end
 
     # Handle final gap
     if total_duration > current_time + 0.01:
         silence_duration = total_duration - current_time
-        if config.fluid and silence_duration > RAMP_DURATION:
-            mid_speed = (1.0 + config.accelerate) / 2.0
-            timeline.append(Segment(
-                start=current_time,
-                end=current_time + RAMP_DURATION,
-                speed_factor=mid_speed
-            ))
-            timeline.append(Segment(
-                start=current_time + RAMP_DURATION,
-                end=total_duration,
-                speed_factor=config.accelerate
+        if fluid and silence_duration > RAMP_DURATION:
+            timeline.extend((
+                Segment(start=current_time,
+                        end=current_time + RAMP_DURATION,
+                        speed_factor=mid_speed),
+                Segment(start=current_time + RAMP_DURATION,
+                        end=total_duration,
+                        speed_factor=accelerate)
             ))
         else:
             timeline.append(Segment(
                 start=current_time,
                 end=total_duration,
-                speed_factor=config.accelerate
+                speed_factor=accelerate
             ))
 
-    return timeline
+    return _coalesce(timeline)
@@ -1,37 +1,86 @@
+import os
+import re
 import sys
 import subprocess
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
 
-console = Console()
+_console = None
+
+
+def _get_console():
+    """Create the shared Rich console on first use (defers rich import)."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str):
+    # Lazy module attribute (PEP 562): both `utils.console` and
+    # `from silentcut.utils import console` resolve through here.
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def format_time(seconds: float) -> str:
     """Format seconds into HH:MM:SS.mmm string."""
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = seconds % 60
-    return f"{h:02d}:{m:02d}:{s:05.3f}"
+    # Work in whole milliseconds: three divmods replace the float
+    # modulo/floor-division mix and the %05.3f float formatting.
+    ms = int(seconds * 1000 + 0.5)
+    h, ms = divmod(ms, 3_600_000)
+    m, ms = divmod(ms, 60_000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
 
 
 def handle_error(message: str, error: Exception | None = None) -> None:
-    """Print error in a Rich panel and exit."""
-    content = message
+    """Print error (Rich panel on a TTY, plain stderr otherwise) and exit."""
+    detail = None
     if error:
         if isinstance(error, subprocess.CalledProcessError):
-            stderr = error.stderr.decode(
-                'utf-8') if error.stderr else str(error)
-            content += f"\n\n[dim]{stderr}[/dim]"
+            stderr = error.stderr
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode('utf-8')
+            detail = stderr or str(error)
         else:
-            content += f"\n\n[dim]{str(error)}[/dim]"
+            detail = str(error)
 
-    console.print(Panel(content, title="Error", style="bold red"))
+    if not sys.stderr.isatty():
+        # Piped or redirected: skip the markup/box-drawing machinery and
+        # write plain text that logs and CI can grep.
+        print(f"Error: {message}", file=sys.stderr)
+        if detail:
+            print(detail, file=sys.stderr)
+    else:
+        from rich.panel import Panel
+        content = (message if detail is None
+                   else f"{message}\n\n[dim]{detail}[/dim]")
+        _get_console().print(Panel(content, title="Error", style="bold red"))
+
+    if os.environ.get("SILENTCUT_FAST_EXIT"):
+        # CLI error exits have nothing to clean up beyond flushed
+        # streams, so skip interpreter teardown entirely. Only the
+        # __main__ entry point sets the flag — library and test callers
+        # still get a catchable SystemExit.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(1)
     sys.exit(1)
 
 
+# ffmpeg doesn't vanish mid-process, so a successful check is remembered
+# and later calls skip spawning "ffmpeg -version" again. Failures are not
+# cached: they exit anyway.
+_ffmpeg_ok = False
+
+
 def ensure_ffmpeg() -> None:
     """Ensure ffmpeg is installed and available in PATH."""
+    global _ffmpeg_ok
+    if _ffmpeg_ok:
+        return
     try:
         subprocess.run(
             ["ffmpeg", "-version"],
@@ -39,6 +88,7 @@ def ensure_ffmpeg() -> None:
             stderr=subprocess.DEVNULL,
             check=True
         )
+        _ffmpeg_ok = True
     except (subprocess.CalledProcessError, FileNotFoundError):
         handle_error(
             "FFmpeg not found. Please install FFmpeg and ensure it's in your PATH.")
@@ -49,9 +99,16 @@ def get_unique_path(path: Path) -> Path:
     if not path.exists():
         return path
 
-    counter = 1
-    while True:
-        new_path = path.parent / f"{path.stem} ({counter}){path.suffix}"
-        if not new_path.exists():
-            return new_path
-        counter += 1
+    # One directory scan instead of an exists() syscall per candidate:
+    # find the highest "stem (n)suffix" counter already taken and go one
+    # past it.
+    pattern = re.compile(
+        rf"{re.escape(path.stem)} \((\d+)\){re.escape(path.suffix)}")
+    highest = 0
+    for entry in path.parent.iterdir():
+        match = pattern.fullmatch(entry.name)
+        if match:
+            n = int(match.group(1))
+            if n > highest:
+                highest = n
+    return path.parent / f"{path.stem} ({highest + 1}){path.suffix}"
@@ -1,11 +1,30 @@
+import shutil
 import subprocess
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def no_fast_exit(monkeypatch):
+    """Keep error exits on SystemExit so test runners can catch them.
+
+    The CLI sets SILENTCUT_FAST_EXIT so handle_error can os._exit; an
+    empty value disables that and restores the ordinary sys.exit path.
+    """
+    monkeypatch.setenv("SILENTCUT_FAST_EXIT", "")
+
+
 @pytest.fixture(scope="session")
-def video_with_silence(tmp_path_factory):
+def video_with_silence(tmp_path_factory, pytestconfig):
     """2s speech + 2s silence + 2s speech at -40dB threshold."""
     out = tmp_path_factory.mktemp("fixtures") / "test.mp4"
+
+    # The fixture is deterministic, so keep a copy in pytest's own cache
+    # directory and skip the ffmpeg encode on every run after the first.
+    cached = pytestconfig.cache.mkdir("silentcut") / "test.mp4"
+    if cached.exists():
+        shutil.copy(cached, out)
+        return out
+
     subprocess.run([
         "ffmpeg", "-y", "-f", "lavfi",
         "-i", "sine=frequency=440:duration=2",
@@ -16,4 +35,5 @@ def video_with_silence(tmp_path_factory):
         "-filter_complex", "[0][1][2]concat=n=3:v=0:a=1",
         str(out)
     ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    shutil.copy(out, cached)
     return out
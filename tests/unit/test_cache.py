@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+from silentcut import cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the cache at a fresh directory and reset module state."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    monkeypatch.setattr(cache, "_entries", None)
+    monkeypatch.setattr(cache, "_enabled", True)
+
+
+def test_put_get_roundtrip(tmp_path):
+    target = tmp_path / "video.mp4"
+    target.write_bytes(b"data")
+
+    assert cache.get("duration", str(target)) is None
+    cache.put("duration", str(target), 12.5)
+    assert cache.get("duration", str(target)) == 12.5
+
+    # Survives a fresh load from disk (simulates a new process)
+    cache._entries = None
+    assert cache.get("duration", str(target)) == 12.5
+
+
+def test_modified_file_invalidates(tmp_path):
+    target = tmp_path / "video.mp4"
+    target.write_bytes(b"data")
+    cache.put("duration", str(target), 12.5)
+
+    # Same size, different mtime: the key no longer matches
+    os.utime(target, ns=(1, 1))
+    assert cache.get("duration", str(target)) is None
+
+
+def test_missing_file_is_never_cached(tmp_path):
+    missing = tmp_path / "nope.mp4"
+    cache.put("duration", str(missing), 1.0)
+    assert cache.get("duration", str(missing)) is None
+
+
+def test_disable(tmp_path):
+    # disable() is what the --no-cache flag calls
+    target = tmp_path / "video.mp4"
+    target.write_bytes(b"data")
+    cache.put("duration", str(target), 12.5)
+
+    cache.disable()
+    assert cache.get("duration", str(target)) is None
+
+
+def test_corrupt_cache_file_recovers(tmp_path):
+    target = tmp_path / "video.mp4"
+    target.write_bytes(b"data")
+
+    cache_file = cache._cache_file()
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text("{not json")
+
+    assert cache.get("duration", str(target)) is None
+    cache.put("duration", str(target), 3.0)
+    assert cache.get("duration", str(target)) == 3.0
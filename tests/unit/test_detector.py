@@ -1,5 +1,7 @@
+import io
+
 from silentcut.detector import FFmpegDetector
-from silentcut.models import Segment
+from silentcut.models import Segment, SilenceConfig
 
 
 def test_parse_silence_stderr():
@@ -21,3 +23,137 @@ def test_no_silence_returns_empty():
     detector = FFmpegDetector()
     assert detector._parse_silence_stderr(
         "Random info without silence tags") == []
+
+
+def test_detect_chunk_rebases_and_closes_open_silence(mocker):
+    # Times in chunk output are relative to the chunk's -ss offset; an
+    # open silence at EOF must be closed at the chunk boundary.
+    stderr = (
+        "silencedetect: silence_start: 1.0\n"
+        "silencedetect: silence_end: 2.0 | silence_duration: 1.0\n"
+        "silencedetect: silence_start: 4.0\n"
+    )
+    mocker.patch("silentcut.detector.subprocess.run",
+                 return_value=mocker.Mock(returncode=0, stderr=stderr))
+
+    detector = FFmpegDetector()
+    segments = detector._detect_chunk("in.mp4", 10.0, 15.0, SilenceConfig())
+
+    assert segments == [Segment(start=11.0, end=12.0),
+                        Segment(start=14.0, end=15.0)]
+
+
+def test_detect_ranges_stitches_boundary_silence(mocker):
+    # A silence split by the 5.0 chunk boundary comes back as two pieces
+    # closer than _STITCH_EPSILON and must be fused into one.
+    chunks = {
+        (0.0, 5.0): [Segment(start=1.0, end=2.0), Segment(start=4.0, end=5.0)],
+        (5.0, 10.0): [Segment(start=5.05, end=6.0),
+                      Segment(start=8.0, end=9.0)],
+    }
+    detector = FFmpegDetector()
+    mocker.patch.object(
+        detector, "_detect_chunk",
+        side_effect=lambda path, start, end, config: chunks[(start, end)])
+
+    segments = detector._detect_ranges(
+        "in.mp4", SilenceConfig(), [(0.0, 5.0), (5.0, 10.0)])
+
+    assert segments == [Segment(start=1.0, end=2.0),
+                        Segment(start=4.0, end=6.0),
+                        Segment(start=8.0, end=9.0)]
+
+
+def test_detect_ranges_keeps_disjoint_silences(mocker):
+    chunks = {
+        (0.0, 5.0): [Segment(start=1.0, end=2.0)],
+        (5.0, 10.0): [Segment(start=5.5, end=6.0)],
+    }
+    detector = FFmpegDetector()
+    mocker.patch.object(
+        detector, "_detect_chunk",
+        side_effect=lambda path, start, end, config: chunks[(start, end)])
+
+    segments = detector._detect_ranges(
+        "in.mp4", SilenceConfig(), [(0.0, 5.0), (5.0, 10.0)])
+
+    assert segments == [Segment(start=1.0, end=2.0),
+                        Segment(start=5.5, end=6.0)]
+
+
+def test_detect_parallel_splits_input(mocker):
+    mocker.patch("silentcut.processor.get_video_duration", return_value=10.0)
+    detector = FFmpegDetector()
+    seen = []
+
+    def fake_chunk(path, start, end, config):
+        seen.append((start, end))
+        return [Segment(start=start + 1.0, end=start + 2.0)]
+
+    mocker.patch.object(detector, "_detect_chunk", side_effect=fake_chunk)
+    segments = detector.detect("in.mp4", SilenceConfig(), workers=2)
+
+    assert sorted(seen) == [(0.0, 5.0), (5.0, 10.0)]
+    assert segments == [Segment(start=1.0, end=2.0),
+                        Segment(start=6.0, end=7.0)]
+    assert detector.last_duration == 10.0
+
+
+def test_detect_sampled_scans_windows(mocker):
+    mocker.patch("silentcut.processor.get_video_duration", return_value=90.0)
+    detector = FFmpegDetector()
+    seen = []
+
+    def fake_chunk(path, start, end, config):
+        seen.append((start, end))
+        return []
+
+    mocker.patch.object(detector, "_detect_chunk", side_effect=fake_chunk)
+    segments = detector.detect_sampled("in.mp4", SilenceConfig(), windows=3)
+
+    # 10-second window at the start of each third of the input
+    assert sorted(seen) == [(0.0, 10.0), (30.0, 40.0), (60.0, 70.0)]
+    assert segments == []
+    assert detector.last_duration == 90.0
+
+
+def test_detect_with_volume_fused_pass(mocker):
+    stderr = io.StringIO(
+        "  Duration: 00:00:10.00, start: 0.000000, bitrate: 128 kb/s\n"
+        "silencedetect: silence_start: 1.50\n"
+        "silencedetect: silence_end: 3.20 | silence_duration: 1.70\n"
+        "[Parsed_volumedetect] mean_volume: -23.5 dB\n"
+    )
+    proc = mocker.Mock()
+    proc.stderr = stderr
+    proc.wait.return_value = 0
+    mocker.patch("silentcut.detector.subprocess.Popen", return_value=proc)
+
+    detector = FFmpegDetector()
+    segments, mean_volume = detector.detect_with_volume(
+        "in.mp4", SilenceConfig())
+
+    assert segments == [Segment(start=1.5, end=3.2)]
+    assert mean_volume == -23.5
+    assert detector.last_duration == 10.0
+
+
+def test_detect_ranges_keeps_short_speech_inside_chunk(mocker):
+    # A sub-epsilon speech burst between two silences inside one chunk
+    # is genuine and must not be fused away by the boundary stitching.
+    chunks = {
+        (0.0, 5.0): [Segment(start=1.0, end=2.0)],
+        (5.0, 10.0): [Segment(start=6.0, end=7.0),
+                      Segment(start=7.05, end=8.0)],
+    }
+    detector = FFmpegDetector()
+    mocker.patch.object(
+        detector, "_detect_chunk",
+        side_effect=lambda path, start, end, config: chunks[(start, end)])
+
+    segments = detector._detect_ranges(
+        "in.mp4", SilenceConfig(), [(0.0, 5.0), (5.0, 10.0)])
+
+    assert segments == [Segment(start=1.0, end=2.0),
+                        Segment(start=6.0, end=7.0),
+                        Segment(start=7.05, end=8.0)]
@@ -21,6 +21,8 @@ def test_handle_error_with_exception():
 
 
 def test_ensure_ffmpeg_fail(mocker):
+    # Clear the success memo so the check actually runs
+    mocker.patch("silentcut.utils._ffmpeg_ok", False)
     mocker.patch("subprocess.run",
                  side_effect=FileNotFoundError("Mocked not found"))
     with pytest.raises(SystemExit):
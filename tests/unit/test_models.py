@@ -1,5 +1,6 @@
+import dataclasses
+
 import pytest
-from pydantic import ValidationError
 from silentcut.models import SilenceConfig, Segment
 
 
@@ -11,7 +12,7 @@ def test_silence_config_defaults():
 
 
 def test_config_invalid_threshold():
-    with pytest.raises(ValidationError):
+    with pytest.raises(ValueError):
         SilenceConfig(threshold=5.0)
 
 
@@ -22,5 +23,5 @@ def test_segment_duration():
 
 def test_segment_immutability():
     s = Segment(start=0.0, end=1.0)
-    with pytest.raises(ValidationError):
+    with pytest.raises(dataclasses.FrozenInstanceError):
         s.start = 2.0
@@ -1,3 +1,5 @@
+import pytest
+
 from silentcut.processor import calculate_speech_segments, build_timeline
 from silentcut.models import Segment, SilenceConfig
 
@@ -110,3 +112,33 @@ def test_build_timeline_fluid_ramping():
     assert timeline[3].start == 3.9
     assert timeline[3].end == 4.0
     assert timeline[3].speed_factor == 2.0
+
+
+def test_calculate_speech_segments_vectorized_parity(mocker):
+    # Enough silences to cross _VECTORIZE_MIN_SILENCES, so this input
+    # takes the NumPy branch; disabling the dispatch gives the scalar
+    # sweep on the same input as reference. Irregular spacing plus a
+    # large padding forces overlap consolidation in both paths.
+    import random
+    from silentcut.processor import _VECTORIZE_MIN_SILENCES
+
+    rng = random.Random(42)
+    n = _VECTORIZE_MIN_SILENCES + 8
+    total_duration = 120.0
+    points = sorted(rng.uniform(0.0, total_duration) for _ in range(2 * n))
+    silent_segments = [
+        Segment(start=points[2 * i], end=points[2 * i + 1]) for i in range(n)
+    ]
+    config = SilenceConfig(padding=0.7)
+
+    vectorized = calculate_speech_segments(
+        silent_segments, total_duration, config)
+
+    mocker.patch("silentcut.processor._VECTORIZE_MIN_SILENCES", n + 1)
+    scalar = calculate_speech_segments(
+        silent_segments, total_duration, config)
+
+    assert len(vectorized) == len(scalar)
+    for v, s in zip(vectorized, scalar):
+        assert v.start == pytest.approx(s.start)
+        assert v.end == pytest.approx(s.end)